@@ -73,7 +73,7 @@ class RateLimitMiddleware(BaseHTTPMiddleware):
                 ]
 
                 if len(recent_calls) >= self.calls:
-                    security_logger.warning(f"Rate limit exceeded for IP: {client_ip}")
+                    security_logger.warning("Rate limit exceeded for IP: %s", client_ip)
                     return JSONResponse(
                         status_code=429, content={"detail": "Rate limit exceeded"}
                     )
@@ -104,7 +104,7 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         method = request.method
         path = request.url.path
 
-        app_logger.info(f"Request: {method} {path} | IP: {client_ip}")
+        app_logger.info("Request: %s %s | IP: %s", method, path, client_ip)
 
         response = await call_next(request)
 
@@ -112,14 +112,14 @@ class RequestLoggingMiddleware(BaseHTTPMiddleware):
         status_code = response.status_code
 
         app_logger.info(
-            f"Response: {status_code} | Time: {process_time:.3f}s | Path: {path}"
+            "Response: %s | Time: %.3fs | Path: %s", status_code, process_time, path
         )
 
         response.headers["X-Process-Time"] = str(process_time)
 
         if process_time > 1.0:
             app_logger.warning(
-                f"Slow request: {method} {path} took {process_time:.3f}s"
+                "Slow request: %s %s took %.3fs", method, path, process_time
             )
 
         return response
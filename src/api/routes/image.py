@@ -15,6 +15,8 @@ from src.utils.helpers import Helpers
 
 image_router = APIRouter()
 
+ALLOWED_IMAGE_TYPES = ("image/jpeg", "image/png")
+
 
 @image_router.post(
     "",
@@ -30,7 +32,7 @@ async def upload_image(
     """Upload image metadata."""
     file_size, storage_path = await Helpers.save_uploaded_file(
         file=image,
-        allowed_types=["image/jpeg", "image/png"],
+        allowed_types=ALLOWED_IMAGE_TYPES,
         max_size_mb=5,
     )
 
@@ -28,5 +28,11 @@ else:
     REDIS_PORT = config("REDIS_PORT", cast=int, default=6379)
     REDIS_URL = f"redis://{REDIS_HOST}:{REDIS_PORT}"
 
+# API keys
+if ENV == "PROD":
+    API_KEY_PEPPER = config("API_KEY_PEPPER", cast=str)
+else:
+    API_KEY_PEPPER = config("API_KEY_PEPPER", cast=str, default="dev-api-key-pepper")
+
 # Storage
 UPLOAD_DIR = config("UPLOAD_DIR", cast=str, default="uploads/images")
@@ -1,30 +1,45 @@
 """Log configuration module - Heroku compatible."""
 
+import atexit
 import logging
 import os
+import queue
 import sys
+from logging.handlers import QueueHandler, QueueListener
 
 IS_HEROKU = os.environ.get("DYNO") is not None
 
 
 def setup_logger(name, log_file=None, level=logging.INFO):
-    """Setup a logger with console output and optional file output.On Heroku, only uses console output (stdout)."""
+    """Setup a logger with console output and optional file output.On Heroku, only uses console output (stdout).
+
+    Records are formatted by the stock QueueHandler and handed off through a queue;
+    stream/file I/O happens on a background listener thread instead of the request
+    path.
+    """
     logger = logging.getLogger(name)
     logger.setLevel(level)
 
+    formatter = logging.Formatter(f"%(asctime)s [{name.upper()}] %(message)s")
+
     console_handler = logging.StreamHandler(sys.stdout)
-    console_handler.setFormatter(
-        logging.Formatter(f"%(asctime)s [{name.upper()}] %(message)s")
-    )
-    logger.addHandler(console_handler)
+    console_handler.setFormatter(formatter)
+    handlers = [console_handler]
 
     if not IS_HEROKU and log_file:
         os.makedirs("logs", exist_ok=True)
         file_handler = logging.FileHandler(log_file, mode="a")
-        file_handler.setFormatter(
-            logging.Formatter(f"%(asctime)s [{name.upper()}] %(message)s")
-        )
-        logger.addHandler(file_handler)
+        file_handler.setFormatter(formatter)
+        handlers.append(file_handler)
+
+    log_queue = queue.SimpleQueue()
+    queue_handler = QueueHandler(log_queue)
+    logger.addHandler(queue_handler)
+
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    queue_handler.listener = listener
+    listener.start()
+    atexit.register(listener.stop)
 
     logger.propagate = False
     return logger
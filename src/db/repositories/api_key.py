@@ -1,6 +1,8 @@
 """API Key Repository."""
 
+import asyncio
 import json
+import logging
 
 from databases import Database
 
@@ -14,6 +16,14 @@ from src.models.api_key import ApiKeyCreate, ApiKeyInDb
 from src.services.third_party.redis_client import RedisClient
 from src.utils.helpers import Helpers
 
+app_logger = logging.getLogger("app")
+
+UPDATE_API_KEY_HASH_QUERY = """
+    UPDATE api_keys
+    SET key_hash = :key_hash
+    WHERE id = :id
+"""
+
 
 class ApiKeyRepository(BaseRepository):
     """Repository for API key management and authentication."""
@@ -26,7 +36,7 @@ class ApiKeyRepository(BaseRepository):
     async def create_api_key(self, api_key: ApiKeyCreate) -> str:
         """Create and persist a new API key."""
         api_key_data = api_key.model_dump()
-        api_key_data["id"] = await Helpers.generate_uuid()
+        api_key_data["id"] = Helpers.generate_uuid()
 
         raw_key = Helpers.generate_api_key()
         api_key_data["key_hash"] = Helpers.hash_api_key(raw_key)
@@ -70,13 +80,40 @@ class ApiKeyRepository(BaseRepository):
 
         stored_hash = result["key_hash"]
 
-        if not Helpers.verify_api_key(raw_key, stored_hash):
+        is_legacy_hash = Helpers.is_legacy_api_key_hash(stored_hash)
+        if is_legacy_hash:
+            verified = await asyncio.to_thread(
+                Helpers.verify_api_key, raw_key, stored_hash
+            )
+        else:
+            verified = Helpers.verify_api_key(raw_key, stored_hash)
+
+        if not verified:
             raise NotFoundError("api_key", "verification_failed")
 
         data = dict(result)
+        if is_legacy_hash:
+            try:
+                data["key_hash"] = await self._rehash_legacy_api_key(
+                    data["id"], raw_key
+                )
+            except Exception:
+                # Migration is best-effort; the key itself verified correctly.
+                app_logger.exception(
+                    "Failed to rehash legacy API key %s", data["id"]
+                )
+
         if isinstance(data["scopes"], str):
             try:
                 data["scopes"] = json.loads(result["scopes"])
             except json.JSONDecodeError as e:
                 raise ValueError(f"Corrupt JSON data in 'scopes' field: {e}")  # noqa: B904
         return ApiKeyInDb(**data)  # type: ignore
+
+    async def _rehash_legacy_api_key(self, api_key_id: str, raw_key: str) -> str:
+        """Replace a verified legacy Argon2 hash with the HMAC hash."""
+        key_hash = Helpers.hash_api_key(raw_key)
+        await self.db.execute(
+            UPDATE_API_KEY_HASH_QUERY, values={"key_hash": key_hash, "id": api_key_id}
+        )
+        return key_hash
@@ -29,7 +29,7 @@ class ImageAnalysisRepository(BaseRepository):
     async def create_analysis(self, analysis: ImageAnalysisCreate) -> ImageAnalysisInDb:
         """Create mock AI analysis result."""
         analysis_data = analysis.model_dump()
-        id_ = await Helpers.generate_uuid()
+        id_ = Helpers.generate_uuid()
         analysis_data["id"] = id_
 
         issues_list = analysis_data["issues"] 
@@ -48,7 +48,7 @@ async def close_redis_connection(app: FastAPI) -> None:
     """Connect to redis."""
     try:
         app_logger.info("Disconnecting from redis database")
-        app.state._redis_client.redis.close()
+        await app.state._redis_client.close()
         app_logger.info("Disconnected from redis database")
     except Exception as e:
         app_logger.info("--- Redis AuthenTication Error")
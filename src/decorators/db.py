@@ -31,30 +31,30 @@ def handle_get_database_exceptions(entity_name: str) -> callable:  # type: ignor
             try:
                 return await func(self, *args, **kwargs)
             except sqlite3.IntegrityError as e:
-                logger.exception(f"IntegrityError for {entity_name}")
+                logger.exception("IntegrityError for %s", entity_name)
                 raise DataTypeError(entity_name=entity_name) from e
             except DataError as e:
-                logger.exception(f"DataError for {entity_name}")
+                logger.exception("DataError for %s", entity_name)
                 raise DataTypeError(entity_name=entity_name) from e
             except OperationalError as e:
-                logger.exception(f"OperationalError for {entity_name}")
+                logger.exception("OperationalError for %s", entity_name)
                 raise GeneralDatabaseError(entity_name=entity_name) from e
             except ValueError as e:
-                logger.exception(f"ValueError for {entity_name}")
+                logger.exception("ValueError for %s", entity_name)
                 raise BadRequestError(
                     f"Bad Request: Invalid details for {entity_name}"
                 ) from e
             except NotFoundError:
-                logger.exception(f"NotFoundError for {entity_name}")
+                logger.exception("NotFoundError for %s", entity_name)
                 raise
             except IncorrectCredentialsError:
-                logger.exception(f"Incorrect credentials for {entity_name}")
+                logger.exception("Incorrect credentials for %s", entity_name)
                 raise
             except InvalidTokenError:
-                logger.exception(f"Invalid token for {entity_name}")
+                logger.exception("Invalid token for %s", entity_name)
                 raise
             except Exception as e:
-                logger.exception(f"Unexpected error for {entity_name}")
+                logger.exception("Unexpected error for %s", entity_name)
                 raise InternalServerError(
                     additional_message="Unexpected error. Try again."
                 ) from e
@@ -78,7 +78,7 @@ def handle_post_database_exceptions(
             try:
                 return await func(self, *args, **kwargs)
             except IntegrityError as e:
-                logger.exception(f"IntegrityError for {entity_name}")
+                logger.exception("IntegrityError for %s", entity_name)
                 msg = str(e.orig).lower() if e.orig else ""
                 if "unique" in msg:
                     raise AlreadyExistsError(entity_name=already_exists_entity) from e
@@ -86,27 +86,27 @@ def handle_post_database_exceptions(
                     raise ForeignKeyError(entity_name=foreign_key_entity) from e
                 raise GeneralDatabaseError(entity_name=entity_name) from e
             except DataError as e:
-                logger.exception(f"DataError for {entity_name}")
+                logger.exception("DataError for %s", entity_name)
                 raise DataTypeError(entity_name=entity_name) from e
             except OperationalError as e:
-                logger.exception(f"OperationalError for {entity_name}")
+                logger.exception("OperationalError for %s", entity_name)
                 raise GeneralDatabaseError(entity_name=entity_name) from e
             except ValueError as e:
-                logger.exception(f"ValueError for {entity_name}")
+                logger.exception("ValueError for %s", entity_name)
                 raise BadRequestError(
                     f"Bad Request: Invalid details for {entity_name}"
                 ) from e
             except NotFoundError:
-                logger.exception(f"NotFoundError for {entity_name}")
+                logger.exception("NotFoundError for %s", entity_name)
                 raise
             except IncorrectCredentialsError:
-                logger.exception(f"Incorrect credentials for {entity_name}")
+                logger.exception("Incorrect credentials for %s", entity_name)
                 raise
             except InvalidTokenError:
-                logger.exception(f"Invalid token for {entity_name}")
+                logger.exception("Invalid token for %s", entity_name)
                 raise
             except Exception as e:
-                logger.exception(f"Unexpected error for {entity_name}")
+                logger.exception("Unexpected error for %s", entity_name)
                 raise InternalServerError(
                     additional_message="Unexpected error. Try again."
                 ) from e
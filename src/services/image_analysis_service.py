@@ -1,10 +1,14 @@
 """Image Analysis Service."""
 
-import secrets
+import random
 
 from src.enums.skin import SkinIssue, SkinType
 from src.models.image_analysis import ImageAnalysisCreate
 
+mock_rng = random.Random()  # noqa: S311 - mock data, not security sensitive
+SKIN_TYPES = tuple(SkinType)
+SKIN_ISSUES = tuple(SkinIssue)
+
 
 class ImageAnalysisService:
     """Service for analyzing skin images."""
@@ -17,14 +21,12 @@ class ImageAnalysisService:
     @staticmethod
     def _generate_mock_analysis(image_id: str, image_path: str) -> ImageAnalysisCreate:
         """Generate mock analysis data for development."""
-        skin_types = list(SkinType)
-        detected_skin_type = secrets.choice(skin_types)
+        detected_skin_type = mock_rng.choice(SKIN_TYPES)
 
-        all_issues = list(SkinIssue)
-        num_issues = secrets.randbelow(3) + 1
-        detected_issues = secrets.SystemRandom().sample(all_issues, num_issues)
+        num_issues = mock_rng.randint(1, 3)
+        detected_issues = mock_rng.sample(SKIN_ISSUES, num_issues)
 
-        confidence = round(secrets.SystemRandom().uniform(0.75, 0.98), 2)
+        confidence = round(mock_rng.uniform(0.75, 0.98), 2)
 
         model_version = "v1.0.0-mock"
 
@@ -2,78 +2,159 @@
 
 import logging
 
+from cachetools import TTLCache
+from redis.asyncio import Redis
 from redis.exceptions import RedisError
 
-import redis
-
 app_logger = logging.getLogger("app")
 
+SCAN_BATCH_SIZE = 1000
+LOCAL_CACHE_SIZE = 10_000
+LOCAL_CACHE_TTL = 30
+
 
 class RedisClient:
     """Redis client."""
 
-    def __init__(self, redis_url: str, timeout: int = 5) -> None:
+    def __init__(
+        self, redis_url: str, timeout: int = 5, max_connections: int = 50
+    ) -> None:
         """Initialize Redis client."""
         self.redis_url = redis_url
         self.timeout = timeout
-        self._redis: redis.StrictRedis | None = None
+        self.max_connections = max_connections
+        self._redis: Redis | None = None
+        # Per-process layer for hot keys; entries may lag other workers by up
+        # to LOCAL_CACHE_TTL seconds.
+        self._local: TTLCache = TTLCache(
+            maxsize=LOCAL_CACHE_SIZE, ttl=LOCAL_CACHE_TTL
+        )
+        # Bumped around every write so reads that overlap a write do not put
+        # the value they read back into the local layer.
+        self._write_generation = 0
 
     @property
-    def redis(self) -> redis.StrictRedis:
-        """Lazy load the Redis connection."""
+    def redis(self) -> Redis:
+        """Lazy load the pooled asyncio Redis connection."""
         if self._redis is None:
-            self._redis = redis.StrictRedis.from_url(
-                self.redis_url, socket_timeout=self.timeout, decode_responses=True
+            self._redis = Redis.from_url(
+                self.redis_url,
+                socket_timeout=self.timeout,
+                decode_responses=True,
+                max_connections=self.max_connections,
             )
         assert self._redis is not None
         return self._redis
 
-    def clear_everything(self) -> None:
+    async def close(self) -> None:
+        """Close the connection pool."""
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    def _evict_local(self, cache_key: str) -> None:
+        """Drop a key from the local layer and fence in-flight reads."""
+        self._write_generation += 1
+        self._local.pop(cache_key, None)
+
+    def _evict_local_prefix(self, prefix: str) -> None:
+        """Drop every local key under a prefix and fence in-flight reads."""
+        self._write_generation += 1
+        for cache_key in [k for k in self._local if k.startswith(prefix)]:
+            self._local.pop(cache_key, None)
+
+    def _clear_local(self) -> None:
+        """Drop every local key and fence in-flight reads."""
+        self._write_generation += 1
+        self._local.clear()
+
+    async def clear_everything(self) -> None:
         """Clear ALL data in the current Redis database."""
+        self._clear_local()
         try:
-            self.redis.flushdb()
+            await self.redis.flushdb()
             app_logger.info("All Redis data cleared.")
         except RedisError as e:
-            app_logger.info(f"Redis error: {e}")
+            app_logger.info("Redis error: %s", e)
+        finally:
+            self._clear_local()
 
-    def get_cache(self, *, key: str, repo_name: str) -> str | None:
+    async def get_cache(self, *, key: str, repo_name: str) -> str | None:
         """Get a cached value."""
+        cache_key = f"cache:{repo_name}:{key}"
+        cached_value = self._local.get(cache_key)
+        if cached_value is not None:
+            return cached_value
+        generation = self._write_generation
         try:
-            cache_key = f"cache:{repo_name}:{key}"
-            cached_value = self.redis.get(cache_key)
-            return cached_value if cached_value else None
+            async with self.redis.pipeline(transaction=False) as pipe:
+                pipe.get(cache_key)
+                pipe.pttl(cache_key)
+                cached_value, ttl_ms = await pipe.execute()
+            if not cached_value:
+                return None
+            # Only keep values locally that Redis will hold for at least as
+            # long as the local entry lives (-1 means no expiry).
+            outlives_local = ttl_ms == -1 or ttl_ms >= LOCAL_CACHE_TTL * 1000
+            if outlives_local and generation == self._write_generation:
+                self._local[cache_key] = cached_value
+            return cached_value
         except RedisError as e:
-            app_logger.info(f"Redis error getting cache {key}: {e}")
+            app_logger.info("Redis error getting cache %s: %s", key, e)
             return None
 
-    def set_cache(
+    async def set_cache(
         self, *, repo_name: str, key: str, value: str, ttl: int = 3600
     ) -> bool:
         """Cache a value with TTL (default 1 hour)."""
+        cache_key = f"cache:{repo_name}:{key}"
+        self._evict_local(cache_key)
         try:
-            cache_key = f"cache:{repo_name}:{key}"
-            return self.redis.setex(cache_key, ttl, value)
+            stored = await self.redis.setex(cache_key, ttl, value)
         except RedisError as e:
-            app_logger.info(f"Redis error setting cache {key}: {e}")
+            app_logger.info("Redis error setting cache %s: %s", key, e)
             return False
+        finally:
+            self._evict_local(cache_key)
+
+        # The local layer is filled by get_cache only, where the remaining TTL
+        # and write generation are checked; filling here could let an older
+        # overlapping write win locally.
+        return stored
 
-    def invalidate_cache(self, *, repo_name: str, key: str) -> bool:
+    async def invalidate_cache(self, *, repo_name: str, key: str) -> bool:
         """Invalidate a cached value."""
+        cache_key = f"cache:{repo_name}:{key}"
+        self._evict_local(cache_key)
         try:
-            cache_key = f"cache:{repo_name}:{key}"
-            return self.redis.delete(cache_key) > 0
+            return await self.redis.delete(cache_key) > 0
         except RedisError as e:
-            app_logger.info(f"Redis error invalidating cache {key}: {e}")
+            app_logger.info("Redis error invalidating cache %s: %s", key, e)
             return False
+        finally:
+            self._evict_local(cache_key)
 
-    def invalidate_repo_cache(self, repo_name: str) -> bool:
-        """Invalidate all cached values."""
+    async def invalidate_repo_cache(self, repo_name: str) -> bool:
+        """Invalidate all cached values; return whether any key was deleted."""
+        prefix = f"cache:{repo_name}:"
+        self._evict_local_prefix(prefix)
         try:
-            pattern = f"cache:{repo_name}:*"
-            keys = self.redis.keys(pattern)
-            if keys:
-                return self.redis.delete(*keys) > 0
-            return True
+            pattern = f"{prefix}*"
+            async with self.redis.pipeline(transaction=False) as pipe:
+                batch = []
+                async for key in self.redis.scan_iter(
+                    match=pattern, count=SCAN_BATCH_SIZE
+                ):
+                    batch.append(key)
+                    if len(batch) >= SCAN_BATCH_SIZE:
+                        pipe.delete(*batch)
+                        batch = []
+                if batch:
+                    pipe.delete(*batch)
+                deleted = await pipe.execute()
+            return sum(deleted) > 0
         except RedisError as e:
-            app_logger.info(f"Redis error invalidating all cache: {e}")
+            app_logger.info("Redis error invalidating all cache: %s", e)
             return False
+        finally:
+            self._evict_local_prefix(prefix)
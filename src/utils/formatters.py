@@ -2,6 +2,8 @@
 
 import re
 
+WHITESPACE_PATTERN = re.compile(r"\s+")
+
 
 class Formatters:
     """Formatters class"""
@@ -9,4 +11,4 @@ class Formatters:
     @staticmethod
     def replace_whitespace_with_underscore(text: str) -> str:
         """Remove special characters from a string."""
-        return re.sub(r"\s+", "_", text)
+        return WHITESPACE_PATTERN.sub("_", text)
@@ -1,8 +1,13 @@
 """Helper functions for the project"""
 
+import hashlib
+import hmac
 import logging
 import secrets
+import time
 import uuid
+from collections.abc import Sequence
+from functools import cache, lru_cache
 from pathlib import Path
 from typing import Any
 from uuid import uuid4
@@ -12,45 +17,108 @@ from argon2 import PasswordHasher
 from argon2.exceptions import VerifyMismatchError
 from fastapi import UploadFile
 
-from src.core.config import UPLOAD_DIR
+from src.core.config import API_KEY_PEPPER, UPLOAD_DIR
 from src.errors.core import CustomizedValueError
 
 ph = PasswordHasher()
+api_key_pepper = API_KEY_PEPPER.encode()
 app_logger = logging.getLogger("app")
 
+UPLOAD_CHUNK_SIZE = 64 * 1024
+
+
+@cache
+def get_upload_dir(directory: str) -> Path:
+    """Create the upload directory once per process and return it."""
+    upload_path = Path(directory)
+    upload_path.mkdir(parents=True, exist_ok=True)
+    return upload_path
+
+
+@lru_cache(maxsize=1024)
+def build_select_query(
+    table_name: str,
+    select_fields: tuple[str, ...],
+    condition_keys: tuple[str, ...],
+    order_by: str | tuple[str, ...] | None,
+    limit: int | None,
+) -> str:
+    """Build the SQL text of a SELECT query for a given query shape."""
+    select_clause = ", ".join(select_fields) if select_fields else "*"
+    query = f"SELECT {select_clause} FROM {table_name}"
+
+    if condition_keys:
+        query += " WHERE " + " AND ".join(f"{key} = :{key}" for key in condition_keys)
+
+    if order_by:
+        if isinstance(order_by, tuple):
+            order_by_clause = ", ".join(order_by)
+        else:
+            order_by_clause = order_by
+        query += f" ORDER BY {order_by_clause}"
+
+    if limit:
+        query += f" LIMIT {limit}"
+
+    return query
+
+
+@lru_cache(maxsize=1024)
+def build_create_query(table_name: str, columns: tuple[str, ...]) -> str:
+    """Build the SQL text of an INSERT query for a given set of columns."""
+    placeholders = ", ".join(f":{key}" for key in columns)
+
+    return f"""
+        INSERT INTO {table_name} ({", ".join(columns)})
+        VALUES ({placeholders})
+        RETURNING *
+        """
+
 
 class Helpers:
     """Helpers class"""
 
     @staticmethod
-    async def generate_uuid() -> str:
-        """Generate uuid for user id."""
-        return str(uuid.uuid4())
+    def generate_uuid() -> str:
+        """Generate a time-ordered (version 7) uuid for primary keys."""
+        timestamp_ms = time.time_ns() // 1_000_000
+        value = bytearray(timestamp_ms.to_bytes(6, "big") + secrets.token_bytes(10))
+        value[6] = (value[6] & 0x0F) | 0x70
+        value[8] = (value[8] & 0x3F) | 0x80
+        return str(uuid.UUID(bytes=bytes(value)))
 
     @staticmethod
     def generate_api_key() -> str:
         """Generates a 32-character API key, prefixed with a human-readable identifier."""
         secret = secrets.token_urlsafe(32)
 
-        key_id = str(uuid.uuid4()).replace("-", "")[:8]
+        key_id = secrets.token_hex(4)
 
         return f"api_{key_id}_{secret}"
 
     @staticmethod
     def hash_api_key(raw_key: str) -> str:
-        """Hashes the raw API key using the Argon2 algorithm."""
-        return ph.hash(raw_key)
+        """Hashes the raw API key using HMAC-SHA256 keyed with the server pepper."""
+        return hmac.new(api_key_pepper, raw_key.encode(), hashlib.sha256).hexdigest()
+
+    @staticmethod
+    def is_legacy_api_key_hash(stored_hash: str) -> bool:
+        """Check whether a stored hash predates the HMAC scheme (Argon2)."""
+        return stored_hash.startswith("$argon2")
 
     @staticmethod
     def verify_api_key(raw_key: str, stored_hash: str) -> bool:
-        """Verifies the raw key against the stored Argon2 hash."""
+        """Verifies the raw key against the stored HMAC or legacy Argon2 hash."""
+        if not Helpers.is_legacy_api_key_hash(stored_hash):
+            return hmac.compare_digest(Helpers.hash_api_key(raw_key), stored_hash)
+
         try:
             ph.verify(stored_hash, raw_key)
             return True
         except VerifyMismatchError:
             return False
         except Exception as e:
-            app_logger.exception(f"Error during API key verification: {e}")
+            app_logger.exception("Error during API key verification: %s", e)
             return False
 
     @staticmethod
@@ -62,27 +130,14 @@ class Helpers:
         limit: int | None = None,
     ) -> (str, dict[str, Any]):  # type: ignore
         """Dynamically construct and return an SQL SELECT query."""
-        select_clause = ", ".join(select_fields) if select_fields else "*"
-        query = f"SELECT {select_clause} FROM {table_name}"
-
-        values = {}
-        if conditions:
-            where_clauses = []
-            for key, value in conditions.items():
-                where_clauses.append(f"{key} = :{key}")
-                values[key] = value
-            query += " WHERE " + " AND ".join(where_clauses)
-
-        if order_by:
-            if isinstance(order_by, list):
-                order_by_clause = ", ".join(order_by)
-            else:
-                order_by_clause = order_by
-            query += f" ORDER BY {order_by_clause}"
-
-        if limit:
-            query += f" LIMIT {limit}"
-
+        values = dict(conditions) if conditions else {}
+        query = build_select_query(
+            table_name,
+            tuple(select_fields) if select_fields else (),
+            tuple(values),
+            tuple(order_by) if isinstance(order_by, list) else order_by,
+            limit,
+        )
         return query, values
 
     @staticmethod
@@ -93,24 +148,21 @@ class Helpers:
         if not fields:
             raise ValueError("Fields dictionary cannot be empty")
 
-        columns = ", ".join(fields.keys())
-        placeholders = ", ".join(f":{key}" for key in fields)
-
-        create_query = f"""
-        INSERT INTO {table_name} ({columns})
-        VALUES ({placeholders})
-        RETURNING *
-        """
+        create_query = build_create_query(table_name, tuple(fields))
 
         return create_query, fields
 
     @staticmethod
     async def save_uploaded_file(
         file: UploadFile,
-        allowed_types: list[str] | None = None,
+        allowed_types: Sequence[str] | None = None,
         max_size_mb: int = 5,
+        storage_dir: str | Path | None = None,
     ) -> tuple[int, str]:
-        """Save an uploaded file to disk and return file content, size, and path."""
+        """Stream an uploaded file to disk and return its size and path.
+
+        Files are written to ``storage_dir`` when given, otherwise to UPLOAD_DIR.
+        """
         if not file.filename:
             raise CustomizedValueError("No file was uploaded.")
 
@@ -119,24 +171,34 @@ class Helpers:
                 f"Invalid file format. Only {', '.join(allowed_types)} are supported."
             )
 
-        content = await file.read()
-        file_size = len(content)
-
-        if file_size == 0:
-            raise CustomizedValueError("Uploaded file is empty.")
-
         max_size_bytes = max_size_mb * 1024 * 1024
-        if file_size > max_size_bytes:
+        if file.size is not None and file.size > max_size_bytes:
             raise CustomizedValueError(f"File size exceeds the {max_size_mb}MB limit.")
 
-        upload_path = Path(UPLOAD_DIR)
-        upload_path.mkdir(parents=True, exist_ok=True)
+        chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        if not chunk:
+            raise CustomizedValueError("Uploaded file is empty.")
+
+        upload_path = get_upload_dir(str(storage_dir or UPLOAD_DIR))
 
-        file_extension = Path(file.filename).suffix
+        _, dot, extension = file.filename.rpartition(".")
+        file_extension = f".{extension}" if dot and extension.isalnum() else ""
         unique_filename = f"{uuid4()}{file_extension}"
         file_path = upload_path / unique_filename
 
-        async with aiofiles.open(file_path, "wb") as f:
-            await f.write(content)
+        file_size = 0
+        try:
+            async with aiofiles.open(file_path, "wb") as f:
+                while chunk:
+                    file_size += len(chunk)
+                    if file_size > max_size_bytes:
+                        raise CustomizedValueError(
+                            f"File size exceeds the {max_size_mb}MB limit."
+                        )
+                    await f.write(chunk)
+                    chunk = await file.read(UPLOAD_CHUNK_SIZE)
+        except BaseException:
+            file_path.unlink(missing_ok=True)
+            raise
 
         return file_size, str(file_path)
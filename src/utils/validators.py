@@ -4,6 +4,31 @@ import re
 
 import validators
 
+DISPOSABLE_DOMAINS = frozenset(
+    {
+        "mailinator.com",
+        "10minutemail.com",
+        "temp-mail.org",
+        "yopmail.com",
+        "guerrillamail.com",
+        "discardmail.com",
+        "maildrop.cc",
+        "fakeinbox.com",
+        "getnada.com",
+        "temp.com",
+        "test.com",
+        "test1.com",
+        "test2.com",
+        "temp1.com",
+        "temp2.com",
+    }
+)
+
+DUMMY_EMAIL_PATTERN = re.compile(
+    r"^(?:test|dummy|fake|no-reply|temp|trial|trial1|temp1|temp2|example)@"
+    r"|^[a-zA-Z]@[a-zA-Z]\.[a-zA-Z]{2,}$"
+)
+
 
 class Validators:
     """Validators class."""
@@ -20,39 +45,8 @@ class Validators:
         if email.endswith(".con"):
             return False
 
-        disposable_domains = {
-            "mailinator.com",
-            "10minutemail.com",
-            "temp-mail.org",
-            "yopmail.com",
-            "guerrillamail.com",
-            "discardmail.com",
-            "maildrop.cc",
-            "fakeinbox.com",
-            "getnada.com",
-            "temp.com",
-            "test.com",
-            "test1.com",
-            "test2.com",
-            "temp1.com",
-            "temp2.com",
-        }
-
         domain = email.split("@")[1].lower()
-        if domain in disposable_domains:
+        if domain in DISPOSABLE_DOMAINS:
             return False
 
-        dummy_patterns = [
-            r"^test@",
-            r"^dummy@",
-            r"^fake@",
-            r"^no-reply@",
-            r"^temp@",
-            r"^trial@",
-            r"^trial1@",
-            r"^temp1@",
-            r"^temp2@",
-            r"^example@",
-            r"^[a-zA-Z]@[a-zA-Z]\.[a-zA-Z]{2,}$",
-        ]
-        return not any(re.match(pattern, email) for pattern in dummy_patterns)
+        return DUMMY_EMAIL_PATTERN.match(email) is None
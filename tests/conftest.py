@@ -1,14 +1,21 @@
 """Pytest configuration and fixtures."""
 
 import os
+from collections.abc import Callable
+from io import BytesIO
+from types import MappingProxyType
 from typing import AsyncGenerator, Generator
 from unittest.mock import AsyncMock, MagicMock
 
 import pytest
+from argon2 import PasswordHasher
 from databases import Database
+from fastapi import UploadFile
 from fastapi.testclient import TestClient
 
 from src.api.main import create_app
+from src.models.image import ImageCreate
+from src.models.image_analysis import ImageAnalysisCreate
 from src.services.third_party.redis_client import RedisClient
 
 
@@ -26,9 +33,9 @@ def client(test_app) -> Generator:
         yield c
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_db() -> AsyncMock:
-    """Create mock database."""
+    """Create mock database once per session."""
     db = AsyncMock(spec=Database)
     db.fetch_one = AsyncMock()
     db.fetch_all = AsyncMock()
@@ -36,14 +43,61 @@ def mock_db() -> AsyncMock:
     return db
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def mock_redis() -> MagicMock:
-    """Create mock Redis client."""
+    """Create mock Redis client once per session."""
     redis = MagicMock(spec=RedisClient)
     return redis
 
 
 @pytest.fixture
+def redis_client() -> RedisClient:
+    """RedisClient backed by a mocked redis.asyncio connection."""
+    client = RedisClient("redis://localhost:6379")
+    client._redis = MagicMock()
+    client._redis.setex = AsyncMock(return_value=True)
+    client._redis.delete = AsyncMock(return_value=1)
+    return client
+
+
+@pytest.fixture(autouse=True)
+def reset_mocks(mock_db, mock_redis) -> None:
+    """Reset calls, return values and side effects on the shared mocks."""
+    mock_db.reset_mock(return_value=True, side_effect=True)
+    mock_redis.reset_mock(return_value=True, side_effect=True)
+
+
+@pytest.fixture
+def make_upload_file() -> Callable[..., UploadFile]:
+    """Factory for in-memory UploadFile objects."""
+
+    def _make_upload_file(
+        content: bytes = b"fake image content",
+        filename: str | None = "test.jpg",
+        content_type: str | None = "image/jpeg",
+    ) -> UploadFile:
+        headers = {"content-type": content_type} if content_type else None
+        return UploadFile(filename=filename, file=BytesIO(content), headers=headers)
+
+    return _make_upload_file
+
+
+@pytest.fixture(scope="session")
+def legacy_hasher() -> PasswordHasher:
+    """Argon2 hasher with minimum cost for building legacy API key hashes."""
+    return PasswordHasher(
+        time_cost=1, memory_cost=8, parallelism=1, hash_len=16, salt_len=8
+    )
+
+
+@pytest.fixture(scope="session")
+def legacy_api_key_hashes(legacy_hasher) -> dict[str, str]:
+    """Legacy Argon2 hashes computed once per session, keyed by raw API key."""
+    raw_keys = ["key1", "api_1a2b3c4d_secret"]
+    return {raw_key: legacy_hasher.hash(raw_key) for raw_key in raw_keys}
+
+
+@pytest.fixture(scope="session")
 def sample_image_data():
     """Sample image data for testing."""
     return {
@@ -59,7 +113,7 @@ def sample_image_id():
     return "123e4567-e89b-12d3-a456-426614174000"
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_analysis_data():
     """Sample analysis data for testing."""
     return {
@@ -69,3 +123,43 @@ def sample_analysis_data():
         "confidence_score": 0.92,
         "model_version": "v1.0.0-mock",
     }
+
+
+@pytest.fixture(scope="session")
+def sample_image_create(sample_image_data) -> ImageCreate:
+    """Validated ImageCreate model built once from the sample image data."""
+    return ImageCreate(**sample_image_data)
+
+
+@pytest.fixture(scope="session")
+def sample_analysis_create(sample_analysis_data) -> ImageAnalysisCreate:
+    """Validated ImageAnalysisCreate model built once from the sample analysis."""
+    return ImageAnalysisCreate(**sample_analysis_data)
+
+
+@pytest.fixture(scope="session")
+def mock_image_row(sample_image_data) -> MappingProxyType:
+    """Read-only database row for the sample image."""
+    return MappingProxyType(
+        {
+            **sample_image_data,
+            "id": "123e4567-e89b-12d3-a456-426614174000",
+            "created_at": "2026-01-07T10:00:00",
+            "updated_at": "2026-01-07T10:00:00",
+            "is_deleted": False,
+        }
+    )
+
+
+@pytest.fixture(scope="session")
+def mock_analysis_row(sample_analysis_data) -> MappingProxyType:
+    """Read-only database row for the sample analysis."""
+    return MappingProxyType(
+        {
+            **sample_analysis_data,
+            "id": "456e4567-e89b-12d3-a456-426614174000",
+            "created_at": "2026-01-07T10:00:00",
+            "updated_at": "2026-01-07T10:00:00",
+            "is_deleted": False,
+        }
+    )
@@ -0,0 +1,23 @@
+"""Performance budget tests for API key hashing."""
+
+import pytest
+
+from src.utils.helpers import Helpers
+
+# HMAC-SHA256 takes microseconds; anything near this budget means a
+# memory-hard hash crept back onto the per-request API key path.
+HASH_API_KEY_BUDGET_SECONDS = 0.001
+
+
+@pytest.mark.benchmark
+class TestHashBudget:
+    """Test hashing stays within its time budget."""
+
+    def test_hash_api_key_budget(self, benchmark):
+        """Test hash_api_key mean time stays under budget."""
+        if benchmark.disabled:
+            pytest.skip("pytest-benchmark is disabled (e.g. under xdist -n)")
+        benchmark.pedantic(
+            Helpers.hash_api_key, args=("api_1a2b3c4d_secret",), rounds=100
+        )
+        assert benchmark.stats.stats.mean < HASH_API_KEY_BUDGET_SECONDS
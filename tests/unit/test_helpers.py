@@ -1,28 +1,42 @@
 """Unit tests for helper functions."""
 
-from io import BytesIO
+import asyncio
+import string
 from pathlib import Path
+from unittest.mock import AsyncMock
+from uuid import UUID
 
 import pytest
-from fastapi import UploadFile
 
 from src.errors.core import CustomizedValueError
 from src.utils.helpers import Helpers
 
+LARGE_CONTENT = b"x" * (6 * 1024 * 1024)
+
 
 class TestHelpers:
     """Test Helpers class."""
 
-    @pytest.mark.asyncio
-    async def test_generate_uuid(self):
+    def test_generate_uuid(self):
         """Test UUID generation."""
-        uuid1 = await Helpers.generate_uuid()
-        uuid2 = await Helpers.generate_uuid()
+        uuid1 = Helpers.generate_uuid()
+        uuid2 = Helpers.generate_uuid()
         
         assert isinstance(uuid1, str)
         assert isinstance(uuid2, str)
         assert uuid1 != uuid2
         assert len(uuid1) == 36 
+        assert UUID(uuid1).version == 7
+
+    def test_generate_api_key(self):
+        """Test API key generation format."""
+        api_key = Helpers.generate_api_key()
+        prefix, key_id, _ = api_key.split("_", 2)
+
+        assert prefix == "api"
+        assert len(key_id) == 8
+        assert all(c in string.hexdigits for c in key_id)
+        assert api_key != Helpers.generate_api_key()
 
     def test_hash_api_key(self):
         """Test API key hashing."""
@@ -31,7 +45,8 @@ class TestHelpers:
         
         assert isinstance(hashed, str)
         assert hashed != api_key
-        assert hashed.startswith("$argon2id$")
+        assert len(hashed) == 64
+        assert hashed == Helpers.hash_api_key(api_key)
 
     def test_hash_api_key_different_inputs(self):
         """Test that different API keys produce different hashes."""
@@ -39,49 +54,49 @@ class TestHelpers:
         hash2 = Helpers.hash_api_key("key2")
         assert hash1 != hash2
 
-    def test_generate_select_query_simple(self):
-        """Test simple SELECT query generation."""
-        query, values = Helpers.generate_select_query(
-            table_name="images",
-        )
-        assert "SELECT * FROM images" in query
-        assert values == {}
-
-    def test_generate_select_query_with_conditions(self):
-        """Test SELECT query with WHERE conditions."""
-        query, values = Helpers.generate_select_query(
-            table_name="images",
-            conditions={"id": "123", "is_deleted": False},
-        )
-        assert "SELECT * FROM images" in query
-        assert "WHERE" in query
-        assert "id = :id" in query
-        assert "is_deleted = :is_deleted" in query
-        assert values == {"id": "123", "is_deleted": False}
-
-    def test_generate_select_query_with_fields(self):
-        """Test SELECT query with specific fields."""
-        query, values = Helpers.generate_select_query(
-            table_name="images",
-            select_fields=["id", "content_type", "file_size"],
-        )
-        assert "SELECT id, content_type, file_size FROM images" in query
-
-    def test_generate_select_query_with_order_by(self):
-        """Test SELECT query with ORDER BY."""
-        query, values = Helpers.generate_select_query(
-            table_name="images",
-            order_by="created_at DESC",
-        )
-        assert "ORDER BY created_at DESC" in query
-
-    def test_generate_select_query_with_limit(self):
-        """Test SELECT query with LIMIT."""
-        query, values = Helpers.generate_select_query(
-            table_name="images",
-            limit=10,
-        )
-        assert "LIMIT 10" in query
+    def test_verify_api_key(self):
+        """Test API key verification against an HMAC hash."""
+        hashed = Helpers.hash_api_key("key1")
+        assert Helpers.verify_api_key("key1", hashed)
+        assert not Helpers.verify_api_key("key2", hashed)
+
+    def test_verify_api_key_legacy_argon2_hash(self, legacy_api_key_hashes):
+        """Test API key verification still accepts legacy Argon2 hashes."""
+        hashed = legacy_api_key_hashes["key1"]
+        assert Helpers.is_legacy_api_key_hash(hashed)
+        assert Helpers.verify_api_key("key1", hashed)
+        assert not Helpers.verify_api_key("key2", hashed)
+
+    @pytest.mark.parametrize(
+        ("kwargs", "expected_substrings", "expected_values"),
+        [
+            ({}, ["SELECT * FROM images"], {}),
+            (
+                {"conditions": {"id": "123", "is_deleted": False}},
+                [
+                    "SELECT * FROM images",
+                    "WHERE",
+                    "id = :id",
+                    "is_deleted = :is_deleted",
+                ],
+                {"id": "123", "is_deleted": False},
+            ),
+            (
+                {"select_fields": ["id", "content_type", "file_size"]},
+                ["SELECT id, content_type, file_size FROM images"],
+                {},
+            ),
+            ({"order_by": "created_at DESC"}, ["ORDER BY created_at DESC"], {}),
+            ({"limit": 10}, ["LIMIT 10"], {}),
+        ],
+        ids=["simple", "with_conditions", "with_fields", "with_order_by", "with_limit"],
+    )
+    def test_generate_select_query(self, kwargs, expected_substrings, expected_values):
+        """Test SELECT query generation."""
+        query, values = Helpers.generate_select_query(table_name="images", **kwargs)
+        for substring in expected_substrings:
+            assert substring in query
+        assert values == expected_values
 
     def test_generate_create_query(self):
         """Test INSERT query generation."""
@@ -106,42 +121,49 @@ class TestHelpers:
             Helpers.generate_create_query(table_name="images", fields={})
 
     @pytest.mark.asyncio
-    async def test_save_uploaded_file_valid(self):
+    async def test_save_uploaded_file_valid(self, tmp_path, make_upload_file):
         """Test saving valid uploaded file."""
         content = b"fake image content"
-        file = UploadFile(
-            filename="test.jpg",
-            file=BytesIO(content),
-            headers={"content-type": "image/jpeg"},
-        )
+        file = make_upload_file(content)
         
         file_size, storage_path = await Helpers.save_uploaded_file(
             file=file,
             allowed_types=["image/jpeg", "image/png"],
             max_size_mb=5,
+            storage_dir=tmp_path,
         )
         
         assert file_size == len(content)
         assert storage_path.endswith(".jpg")
-        assert Path(storage_path).exists()
-        
-        Path(storage_path).unlink(missing_ok=True)
+        assert Path(storage_path).parent == tmp_path
+        assert Path(storage_path).read_bytes() == content
+
+    @pytest.mark.asyncio
+    async def test_save_uploaded_file_drops_unsafe_extension(
+        self, tmp_path, make_upload_file
+    ):
+        """Test that a non-alphanumeric extension is not carried to disk."""
+        file = make_upload_file(filename="test.jp g/..")
+
+        _, storage_path = await Helpers.save_uploaded_file(
+            file=file, storage_dir=tmp_path
+        )
+
+        assert Path(storage_path).suffix == ""
 
     @pytest.mark.asyncio
-    async def test_save_uploaded_file_no_filename(self):
+    async def test_save_uploaded_file_no_filename(self, make_upload_file):
         """Test saving file without filename."""
-        file = UploadFile(filename=None, file=BytesIO(b"content"))
+        file = make_upload_file(b"content", filename=None, content_type=None)
         
         with pytest.raises(CustomizedValueError, match="No file was uploaded"):
             await Helpers.save_uploaded_file(file=file)
 
     @pytest.mark.asyncio
-    async def test_save_uploaded_file_invalid_type(self):
+    async def test_save_uploaded_file_invalid_type(self, make_upload_file):
         """Test saving file with invalid content type."""
-        file = UploadFile(
-            filename="test.pdf",
-            file=BytesIO(b"content"),
-            headers={"content-type": "application/pdf"},
+        file = make_upload_file(
+            b"content", filename="test.pdf", content_type="application/pdf"
         )
         
         with pytest.raises(CustomizedValueError, match="Invalid file format"):
@@ -151,30 +173,37 @@ class TestHelpers:
             )
 
     @pytest.mark.asyncio
-    async def test_save_uploaded_file_empty(self):
+    async def test_save_uploaded_file_empty(self, make_upload_file):
         """Test saving empty file."""
-        file = UploadFile(
-            filename="test.jpg",
-            file=BytesIO(b""),
-            headers={"content-type": "image/jpeg"},
-        )
+        file = make_upload_file(b"")
         
         with pytest.raises(CustomizedValueError, match="Uploaded file is empty"):
             await Helpers.save_uploaded_file(file=file)
 
     @pytest.mark.asyncio
-    async def test_save_uploaded_file_exceeds_size(self):
+    async def test_save_uploaded_file_exceeds_size(self, tmp_path, make_upload_file):
         """Test saving file that exceeds size limit."""
-        large_content = b"x" * (6 * 1024 * 1024)
-        file = UploadFile(
-            filename="large.jpg",
-            file=BytesIO(large_content),
-            headers={"content-type": "image/jpeg"},
-        )
+        file = make_upload_file(LARGE_CONTENT, filename="large.jpg")
         
         with pytest.raises(CustomizedValueError, match="File size exceeds"):
             await Helpers.save_uploaded_file(
                 file=file,
                 allowed_types=["image/jpeg"],
                 max_size_mb=5,
+                storage_dir=tmp_path,
             )
+
+        assert not any(tmp_path.iterdir())
+
+    @pytest.mark.asyncio
+    async def test_save_uploaded_file_cancelled_mid_stream(
+        self, tmp_path, make_upload_file
+    ):
+        """Test a cancelled upload leaves no partial file behind."""
+        file = make_upload_file()
+        file.read = AsyncMock(side_effect=[b"first chunk", asyncio.CancelledError()])
+
+        with pytest.raises(asyncio.CancelledError):
+            await Helpers.save_uploaded_file(file=file, storage_dir=tmp_path)
+
+        assert not any(tmp_path.iterdir())
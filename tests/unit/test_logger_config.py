@@ -0,0 +1,54 @@
+"""Unit tests for logger configuration."""
+
+import atexit
+import logging
+
+from src.core.logger_config import setup_logger
+
+
+class TestSetupLogger:
+    """Test setup_logger queue hand-off."""
+
+    def test_listener_writes_formatted_records(self, tmp_path, monkeypatch, capsys):
+        """Test console and file handlers receive formatted output via the listener."""
+        monkeypatch.chdir(tmp_path)
+        log_file = tmp_path / "test.log"
+        logger = setup_logger("queue-test", str(log_file))
+        payload = {"state": "before"}
+
+        logger.info("payload %s", payload)
+        payload["state"] = "after"
+        try:
+            raise ValueError("boom")
+        except ValueError:
+            logger.exception("failed %d", 42)
+
+        queue_handler = logger.handlers[0]
+        queue_handler.listener.stop()
+        atexit.unregister(queue_handler.listener.stop)
+        for handler in queue_handler.listener.handlers:
+            handler.close()
+        logger.removeHandler(queue_handler)
+
+        for output in (capsys.readouterr().out, log_file.read_text()):
+            assert "[QUEUE-TEST] payload {'state': 'before'}" in output
+            assert "[QUEUE-TEST] failed 42" in output
+            assert "ValueError: boom" in output
+            assert "%s" not in output
+
+    def test_logger_level_respected(self, tmp_path, monkeypatch, capsys):
+        """Test records below the logger level never reach the handlers."""
+        monkeypatch.chdir(tmp_path)
+        logger = setup_logger("queue-level-test", level=logging.ERROR)
+
+        logger.info("dropped")
+        logger.error("kept")
+
+        queue_handler = logger.handlers[0]
+        queue_handler.listener.stop()
+        atexit.unregister(queue_handler.listener.stop)
+        logger.removeHandler(queue_handler)
+
+        output = capsys.readouterr().out
+        assert "kept" in output
+        assert "dropped" not in output
@@ -0,0 +1,182 @@
+"""Unit tests for the Redis client."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+
+def mock_pipeline(redis_client, results):
+    """Attach a pipeline whose execute() returns the given results."""
+    pipe = MagicMock()
+    pipe.__aenter__ = AsyncMock(return_value=pipe)
+    pipe.__aexit__ = AsyncMock(return_value=False)
+    pipe.execute = AsyncMock(return_value=results)
+    redis_client.redis.pipeline.return_value = pipe
+    return pipe
+
+
+def mock_scan(redis_client, keys):
+    """Make scan_iter yield the given keys."""
+
+    async def scan_iter(**kwargs):
+        for key in keys:
+            yield key
+
+    redis_client.redis.scan_iter = MagicMock(side_effect=scan_iter)
+
+
+class TestRedisClientCache:
+    """Test RedisClient cache helpers and local layer."""
+
+    @pytest.mark.asyncio
+    async def test_get_cache_local_hit_skips_redis(self, redis_client):
+        """Test a local hit is served without touching Redis."""
+        redis_client._local["cache:images:1"] = "local"
+
+        result = await redis_client.get_cache(key="1", repo_name="images")
+
+        assert result == "local"
+        redis_client.redis.pipeline.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_cache_redis_hit_fills_local(self, redis_client):
+        """Test a Redis hit with a long remaining TTL fills the local layer."""
+        pipe = mock_pipeline(redis_client, ["remote", 60_000])
+
+        result = await redis_client.get_cache(key="1", repo_name="images")
+
+        assert result == "remote"
+        assert redis_client._local["cache:images:1"] == "remote"
+        pipe.get.assert_called_once_with("cache:images:1")
+        pipe.pttl.assert_called_once_with("cache:images:1")
+
+    @pytest.mark.asyncio
+    async def test_get_cache_miss(self, redis_client):
+        """Test a Redis miss returns None and caches nothing."""
+        mock_pipeline(redis_client, [None, -2])
+
+        result = await redis_client.get_cache(key="1", repo_name="images")
+
+        assert result is None
+        assert "cache:images:1" not in redis_client._local
+
+    @pytest.mark.asyncio
+    async def test_short_ttl_value_is_never_cached_locally(self, redis_client):
+        """Test a short-TTL value stays out of the local layer on write and read."""
+        stored = await redis_client.set_cache(
+            repo_name="images", key="1", value="short", ttl=10
+        )
+
+        assert stored is True
+        assert "cache:images:1" not in redis_client._local
+
+        mock_pipeline(redis_client, ["short", 9_000])
+        result = await redis_client.get_cache(key="1", repo_name="images")
+
+        assert result == "short"
+        assert "cache:images:1" not in redis_client._local
+
+    @pytest.mark.asyncio
+    async def test_set_cache_evicts_without_filling_local(self, redis_client):
+        """Test a write drops the old local value and leaves the fill to reads."""
+        redis_client._local["cache:images:1"] = "old"
+
+        await redis_client.set_cache(repo_name="images", key="1", value="v")
+
+        redis_client.redis.setex.assert_awaited_once_with("cache:images:1", 3600, "v")
+        assert "cache:images:1" not in redis_client._local
+
+    @pytest.mark.asyncio
+    async def test_interleaved_set_cache_does_not_keep_older_value(
+        self, redis_client
+    ):
+        """Test overlapping writes never leave the losing value in the local layer."""
+        first_sent = asyncio.Event()
+        release_first = asyncio.Event()
+
+        async def setex(cache_key, ttl, value):
+            if value == "v1":
+                first_sent.set()
+                await release_first.wait()
+            return True
+
+        redis_client.redis.setex = AsyncMock(side_effect=setex)
+
+        first = asyncio.create_task(
+            redis_client.set_cache(repo_name="images", key="1", value="v1")
+        )
+        await first_sent.wait()
+        await redis_client.set_cache(repo_name="images", key="1", value="v2")
+        release_first.set()
+        await first
+
+        assert "cache:images:1" not in redis_client._local
+
+    @pytest.mark.asyncio
+    async def test_clear_everything_empties_local(self, redis_client):
+        """Test clear_everything drops every local key."""
+        redis_client.redis.flushdb = AsyncMock()
+        redis_client._local["cache:images:1"] = "a"
+        redis_client._local["other:1"] = "b"
+
+        await redis_client.clear_everything()
+
+        assert len(redis_client._local) == 0
+
+    @pytest.mark.asyncio
+    async def test_get_cache_overlapping_write_does_not_fill_local(
+        self, redis_client
+    ):
+        """Test a read that overlaps an invalidation does not refill the layer."""
+        pipe = mock_pipeline(redis_client, ["stale", 60_000])
+
+        async def execute_during_invalidation():
+            await redis_client.invalidate_cache(repo_name="images", key="1")
+            return ["stale", 60_000]
+
+        pipe.execute = AsyncMock(side_effect=execute_during_invalidation)
+
+        await redis_client.get_cache(key="1", repo_name="images")
+
+        assert "cache:images:1" not in redis_client._local
+
+    @pytest.mark.asyncio
+    async def test_invalidate_cache_evicts_only_that_key(self, redis_client):
+        """Test invalidate_cache evicts the matching local key only."""
+        redis_client._local["cache:images:1"] = "a"
+        redis_client._local["cache:images:2"] = "b"
+
+        result = await redis_client.invalidate_cache(repo_name="images", key="1")
+
+        assert result is True
+        assert "cache:images:1" not in redis_client._local
+        assert redis_client._local["cache:images:2"] == "b"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_repo_cache_evicts_only_repo_prefix(self, redis_client):
+        """Test invalidate_repo_cache evicts local keys under the repo prefix."""
+        redis_client._local["cache:images:1"] = "a"
+        redis_client._local["cache:images:2"] = "b"
+        redis_client._local["cache:image_analysis:1"] = "c"
+        mock_scan(redis_client, ["cache:images:1", "cache:images:2"])
+        pipe = mock_pipeline(redis_client, [2])
+
+        result = await redis_client.invalidate_repo_cache("images")
+
+        assert result is True
+        pipe.delete.assert_called_once_with("cache:images:1", "cache:images:2")
+        assert "cache:images:1" not in redis_client._local
+        assert "cache:images:2" not in redis_client._local
+        assert redis_client._local["cache:image_analysis:1"] == "c"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_repo_cache_nothing_matched(self, redis_client):
+        """Test invalidate_repo_cache returns False when no key was deleted."""
+        mock_scan(redis_client, [])
+        pipe = mock_pipeline(redis_client, [])
+
+        result = await redis_client.invalidate_repo_cache("images")
+
+        assert result is False
+        pipe.delete.assert_not_called()
@@ -4,32 +4,26 @@ from uuid import UUID
 
 import pytest
 
+from src.db.repositories.api_key import ApiKeyRepository
 from src.db.repositories.image import ImageRepository
 from src.db.repositories.image_analysis import ImageAnalysisRepository
 from src.errors.database import NotFoundError
-from src.models.image import ImageCreate
-from src.models.image_analysis import ImageAnalysisCreate
+from src.utils.helpers import Helpers
 
 
 class TestImageRepository:
     """Test ImageRepository."""
 
     @pytest.mark.asyncio
-    async def test_create_image(self, mock_db, mock_redis, sample_image_data):
+    async def test_create_image(
+        self, mock_db, mock_redis, mock_image_row, sample_image_create
+    ):
         """Test creating an image."""
-        mock_result = {
-            **sample_image_data,
-            "id": "123e4567-e89b-12d3-a456-426614174000",
-            "created_at": "2026-01-07T10:00:00",
-            "updated_at": "2026-01-07T10:00:00",
-            "is_deleted": False,
-        }
-        mock_db.fetch_one.return_value = mock_result
+        mock_db.fetch_one.return_value = mock_image_row
         
         repo = ImageRepository(db=mock_db, r_db=mock_redis)
-        image_create = ImageCreate(**sample_image_data)
         
-        result = await repo.create_image(image_create)
+        result = await repo.create_image(sample_image_create)
         
         assert str(result.id) == "123e4567-e89b-12d3-a456-426614174000"
         assert result.content_type == "image/jpeg"
@@ -37,17 +31,10 @@ class TestImageRepository:
         mock_db.fetch_one.assert_called_once()
 
     @pytest.mark.asyncio
-    async def test_get_image_found(self, mock_db, mock_redis, sample_image_data):
+    async def test_get_image_found(self, mock_db, mock_redis, mock_image_row):
         """Test getting an existing image."""
         image_id = UUID("123e4567-e89b-12d3-a456-426614174000")
-        mock_result = {
-            **sample_image_data,
-            "id": str(image_id),
-            "created_at": "2026-01-07T10:00:00",
-            "updated_at": "2026-01-07T10:00:00",
-            "is_deleted": False,
-        }
-        mock_db.fetch_one.return_value = mock_result
+        mock_db.fetch_one.return_value = mock_image_row
         
         repo = ImageRepository(db=mock_db, r_db=mock_redis)
         result = await repo.get_image(image_id)
@@ -73,22 +60,19 @@ class TestImageAnalysisRepository:
 
     @pytest.mark.asyncio
     async def test_create_analysis(
-        self, mock_db, mock_redis, sample_analysis_data
+        self,
+        mock_db,
+        mock_redis,
+        sample_analysis_data,
+        sample_analysis_create,
+        mock_analysis_row,
     ):
         """Test creating an analysis."""
-        mock_result = {
-            **sample_analysis_data,
-            "id": "456e4567-e89b-12d3-a456-426614174000",
-            "created_at": "2026-01-07T10:00:00",
-            "updated_at": "2026-01-07T10:00:00",
-            "is_deleted": False,
-        }
-        mock_db.fetch_one.return_value = mock_result
+        mock_db.fetch_one.return_value = mock_analysis_row
         
         repo = ImageAnalysisRepository(db=mock_db, r_db=mock_redis)
-        analysis_create = ImageAnalysisCreate(**sample_analysis_data)
         
-        result = await repo.create_analysis(analysis_create)
+        result = await repo.create_analysis(sample_analysis_create)
         
         assert str(result.id) == "456e4567-e89b-12d3-a456-426614174000"
         assert result.image_id == sample_analysis_data["image_id"]
@@ -97,18 +81,11 @@ class TestImageAnalysisRepository:
 
     @pytest.mark.asyncio
     async def test_get_latest_analysis_found(
-        self, mock_db, mock_redis, sample_analysis_data
+        self, mock_db, mock_redis, mock_analysis_row
     ):
         """Test getting latest analysis for an image."""
         image_id = UUID("123e4567-e89b-12d3-a456-426614174000")
-        mock_result = {
-            **sample_analysis_data,
-            "id": "456e4567-e89b-12d3-a456-426614174000",
-            "created_at": "2026-01-07T10:00:00",
-            "updated_at": "2026-01-07T10:00:00",
-            "is_deleted": False,
-        }
-        mock_db.fetch_one.return_value = mock_result
+        mock_db.fetch_one.return_value = mock_analysis_row
         
         repo = ImageAnalysisRepository(db=mock_db, r_db=mock_redis)
         result = await repo.get_latest_analysis(image_id)
@@ -129,3 +106,89 @@ class TestImageAnalysisRepository:
         
         with pytest.raises(NotFoundError):
             await repo.get_latest_analysis(image_id)
+
+
+API_KEY_ID = "789e4567-e89b-12d3-a456-426614174000"
+RAW_API_KEY = "api_1a2b3c4d_secret"
+
+
+def make_api_key_row(key_hash: str) -> dict:
+    """Build an api_keys row for RAW_API_KEY with the given stored hash."""
+    return {
+        "id": API_KEY_ID,
+        "name": "client",
+        "scopes": '["upload"]',
+        "key_hash": key_hash,
+        "key_prefix": "api_1a2b3c4d",
+        "is_active": True,
+        "created_at": "2026-01-07T10:00:00",
+        "updated_at": "2026-01-07T10:00:00",
+        "is_deleted": False,
+    }
+
+
+class TestApiKeyRepository:
+    """Test ApiKeyRepository."""
+
+    @pytest.mark.asyncio
+    async def test_get_active_api_key_rehashes_legacy_hash(
+        self, mock_db, mock_redis, legacy_api_key_hashes
+    ):
+        """Test a verified legacy Argon2 hash is replaced with the HMAC hash."""
+        mock_db.fetch_one.return_value = make_api_key_row(
+            legacy_api_key_hashes[RAW_API_KEY]
+        )
+
+        repo = ApiKeyRepository(db=mock_db, r_db=mock_redis)
+        result = await repo.get_active_api_key(RAW_API_KEY)
+
+        assert result.key_hash == Helpers.hash_api_key(RAW_API_KEY)
+        mock_db.execute.assert_called_once()
+        assert mock_db.execute.call_args.kwargs["values"] == {
+            "key_hash": Helpers.hash_api_key(RAW_API_KEY),
+            "id": API_KEY_ID,
+        }
+
+    @pytest.mark.asyncio
+    async def test_get_active_api_key_rehash_failure_keeps_legacy_hash(
+        self, mock_db, mock_redis, legacy_api_key_hashes
+    ):
+        """Test a failed rehash still returns the verified key."""
+        legacy_hash = legacy_api_key_hashes[RAW_API_KEY]
+        mock_db.fetch_one.return_value = make_api_key_row(legacy_hash)
+        mock_db.execute.side_effect = RuntimeError("database is read-only")
+
+        repo = ApiKeyRepository(db=mock_db, r_db=mock_redis)
+        result = await repo.get_active_api_key(RAW_API_KEY)
+
+        assert str(result.id) == API_KEY_ID
+        assert result.key_hash == legacy_hash
+        mock_db.execute.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_get_active_api_key_wrong_key_legacy_hash(
+        self, mock_db, mock_redis, legacy_api_key_hashes
+    ):
+        """Test a wrong key against a legacy hash is rejected and never rehashed."""
+        mock_db.fetch_one.return_value = make_api_key_row(
+            legacy_api_key_hashes[RAW_API_KEY]
+        )
+
+        repo = ApiKeyRepository(db=mock_db, r_db=mock_redis)
+
+        with pytest.raises(NotFoundError):
+            await repo.get_active_api_key("api_1a2b3c4d_wrong")
+        mock_db.execute.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_get_active_api_key_hmac_hash(self, mock_db, mock_redis):
+        """Test a key stored with an HMAC hash verifies without any write."""
+        key_hash = Helpers.hash_api_key(RAW_API_KEY)
+        mock_db.fetch_one.return_value = make_api_key_row(key_hash)
+
+        repo = ApiKeyRepository(db=mock_db, r_db=mock_redis)
+        result = await repo.get_active_api_key(RAW_API_KEY)
+
+        assert str(result.id) == API_KEY_ID
+        assert result.key_hash == key_hash
+        mock_db.execute.assert_not_called()